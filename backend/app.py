@@ -14,6 +14,13 @@ GET /health
 POST /analyze
     Accepts raw quote text and returns a structured QuoteCheckResult.
 
+POST /analyze/stream
+    Server-sent-events variant of /analyze (progressive output).
+
+POST /analyze/batch, GET /analyze/batch/{batch_id}
+    Offline bulk analysis via the OpenAI Batch API
+    (QUOTECHECK_BATCH_MODE=1 + OpenAI mode only).
+
 Runtime modes (feature-flagged)
 -------------------------------
 The analyzer supports two modes controlled by environment/config:
@@ -48,32 +55,59 @@ Configuration and secrets
 
 from __future__ import annotations
 
-from dotenv import load_dotenv
-load_dotenv("backend/.env")
+import os
+
+# Local development loads the untracked backend/.env. Managed deployments
+# (uvicorn --workers, docker, systemd) already inject env vars into the
+# process, so they can set QUOTECHECK_SKIP_DOTENV=1 to avoid re-parsing the
+# file in every worker and on every autoreload. Default behaviour (dev) is
+# unchanged.
+if os.environ.get("QUOTECHECK_SKIP_DOTENV") != "1":
+    from dotenv import load_dotenv
+    load_dotenv("backend/.env")
 
 import time
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 
-from backend.core.schema import AnalyzeRequest, QuoteCheckResult
+from backend.core.schema import AnalyzeRequest, BatchAnalyzeRequest, QuoteCheckResult, dump_result_json
 from backend.core.run_logger import log_app_run
 from backend.core.prompt import PROMPT_VERSION
-from backend.core.config import APP_RUN_LOG_PATH, USE_OPENAI, MODEL
-from backend.core.openai_analyzer import analyze_quote_openai
-from backend.core.stub_analyzer import analyze_quote_stub
+from backend.core.config import APP_RUN_LOG_PATH, BATCH_MODE, USE_OPENAI, MODEL
+
+# Only the selected analyzer is imported: in stub mode this skips the OpenAI
+# SDK + httpx import and client construction entirely, and in OpenAI mode it
+# skips the stub's import-time LineItem validation and regex compilation.
+# USE_OPENAI is fixed for the process lifetime, so the unused branch's names
+# are never referenced.
+if USE_OPENAI:
+    from backend.core.openai_analyzer import analyze_quote_openai, analyze_quote_openai_stream
+else:
+    from backend.core.stub_analyzer import analyze_quote_stub
 
 
 app = FastAPI(title="QuoteCheck API", version="0.1.0")
 
+# Response compression: analyze responses are repetitive JSON (enum names,
+# rationale prose) that compresses well; compresslevel=1 keeps the CPU cost
+# negligible and minimum_size skips tiny payloads like /health. Added before
+# CORS so CORS ends up outermost and stamps headers on every response.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
+
 # Local development CORS policy.
-# Vite dev server typically runs on http://localhost:5173
+# Vite dev server typically runs on http://localhost:5173; the precompiled
+# origin regex replaces the per-request list membership check.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://127.0.0.1:5173"],
+    allow_origin_regex=r"http://(localhost|127\.0\.0\.1):5173",
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -93,15 +127,77 @@ def health():
     return {"status": "ok"}
 
 
-@app.post("/analyze", response_model=QuoteCheckResult)
-def analyze(req: AnalyzeRequest):
+def _log_analyze_success(*, result: QuoteCheckResult, request_id: str, latency_ms: int) -> None:
+    """Write the one success JSONL record for an /analyze-family request."""
+    # risk_level is a Literal field, so it's already the plain
+    # "red"/"yellow"/"green" string.
+    rc = Counter(it.risk_level for it in result.line_items)
+    log_app_run(
+        log_path=APP_RUN_LOG_PATH,
+        request_id=request_id,
+        prompt_version=result.metadata.prompt_version,
+        model=result.metadata.model,
+        latency_ms=latency_ms,
+        schema_valid=True,
+        num_items=len(result.line_items),
+        risk_counts={"red": rc.get("red", 0), "yellow": rc.get("yellow", 0), "green": rc.get("green", 0)},
+        uncertainty=result.uncertainty_markers.model_dump(),
+        error=None,
+    )
+
+
+def _log_analyze_payload_success(*, payload: dict, request_id: str, latency_ms: int) -> None:
+    """Success JSONL record for the OpenAI passthrough path (plain-dict payload)."""
+    rc = Counter(it["risk_level"] for it in payload["line_items"])
+    log_app_run(
+        log_path=APP_RUN_LOG_PATH,
+        request_id=request_id,
+        prompt_version=payload["metadata"]["prompt_version"],
+        model=payload["metadata"]["model"],
+        latency_ms=latency_ms,
+        schema_valid=True,
+        num_items=len(payload["line_items"]),
+        risk_counts={"red": rc.get("red", 0), "yellow": rc.get("yellow", 0), "green": rc.get("green", 0)},
+        uncertainty=payload["uncertainty_markers"],
+        error=None,
+    )
+
+
+def _log_analyze_failure(*, request_id: str, latency_ms: int, error: Exception) -> None:
+    """Write the one failure JSONL record for an /analyze-family request."""
+    log_app_run(
+        log_path=APP_RUN_LOG_PATH,
+        request_id=request_id,
+        prompt_version=PROMPT_VERSION,
+        model=MODEL,
+        latency_ms=latency_ms,
+        schema_valid=False,
+        num_items=0,
+        risk_counts={"red": 0, "yellow": 0, "green": 0},
+        uncertainty={},
+        error=f"{type(error).__name__}: {error}",
+    )
+
+
+@app.post("/analyze")
+async def analyze(req: AnalyzeRequest):
     """
     Analyze a service quote and return a structured QuoteCheckResult.
 
+    The response body is encoded to bytes exactly once and returned as-is,
+    instead of going through FastAPI's response_model path, which would
+    re-validate and re-encode the model.
+
     Routing
     -------
-    - If USE_OPENAI is enabled: call OpenAI analyzer (Responses API, strict schema)
-    - Otherwise: call deterministic stub analyzer
+    - If USE_OPENAI is enabled: await the async OpenAI analyzer (Responses API,
+      strict schema). The handler is async so the event loop stays free while
+      the model call is in flight, instead of pinning a threadpool worker.
+      The analyzer returns ready-to-send bytes: the schema is enforced
+      upstream by strict structured output, so the default path skips the
+      Pydantic re-validation pass (QUOTECHECK_STRICT_VALIDATE=1 restores it).
+    - Otherwise: call deterministic stub analyzer (pure CPU, no await needed)
+      and serialize its validated model with dump_result_json (compact form).
 
     Observability
     -------------
@@ -109,50 +205,112 @@ def analyze(req: AnalyzeRequest):
     (success or failure), including risk_counts and uncertainty markers.
     """
     t0 = time.perf_counter()
-    request_id = str(uuid.uuid4())
+    request_id = uuid.uuid4().hex  # .hex skips the dashed-string formatting pass
 
     try:
         # Analyzer selection (keeps app.py thin)
         if USE_OPENAI:
-            result, latency_ms = analyze_quote_openai(quote_text=req.quote_text, request_id=request_id)
+            body, payload, latency_ms = await analyze_quote_openai(
+                quote_text=req.quote_text, request_id=request_id, no_cache=req.no_cache
+            )
+            _log_analyze_payload_success(payload=payload, request_id=request_id, latency_ms=latency_ms)
         else:
             latency_ms = int((time.perf_counter() - t0) * 1000)
             result = analyze_quote_stub(quote_text=req.quote_text, request_id=request_id, latency_ms=latency_ms)
+            _log_analyze_success(result=result, request_id=request_id, latency_ms=latency_ms)
+            body = dump_result_json(result)
 
-        # Common: compute risk_counts for logs
-        risk_counts = {"red": 0, "yellow": 0, "green": 0}
-        for it in result.line_items:
-            rl = it.risk_level.value if hasattr(it.risk_level, "value") else str(it.risk_level).lower()
-            if rl in risk_counts:
-                risk_counts[rl] += 1
-
-        # Common: success logging
-        log_app_run(
-            log_path=APP_RUN_LOG_PATH,
-            request_id=request_id,
-            prompt_version=result.metadata.prompt_version,
-            model=result.metadata.model,
-            latency_ms=latency_ms,
-            schema_valid=True,
-            num_items=len(result.line_items),
-            risk_counts=risk_counts,
-            uncertainty=result.uncertainty_markers.model_dump(),
-            error=None,
-        )
-        return result
+        return Response(content=body, media_type="application/json", headers={"x-request-id": request_id})
 
     except Exception as e:
         latency_ms = int((time.perf_counter() - t0) * 1000)
-        log_app_run(
-            log_path=APP_RUN_LOG_PATH,
-            request_id=request_id,
-            prompt_version=PROMPT_VERSION,
-            model=MODEL,
-            latency_ms=latency_ms,
-            schema_valid=False,
-            num_items=0,
-            risk_counts={"red": 0, "yellow": 0, "green": 0},
-            uncertainty={},
-            error=f"{type(e).__name__}: {e}",
+        _log_analyze_failure(request_id=request_id, latency_ms=latency_ms, error=e)
+        raise
+
+
+@app.post("/analyze/stream")
+async def analyze_stream(req: AnalyzeRequest):
+    """
+    Streaming variant of /analyze (server-sent events).
+
+    Events
+    ------
+    - `delta`: a raw text chunk of the model's JSON output, as generated.
+      The client can accumulate chunks for progressive rendering.
+    - `result`: the final schema-validated QuoteCheckResult (same JSON as
+      /analyze), always sent exactly once on success.
+    - `error`: short error string; the stream ends after it.
+
+    Stub mode produces no deltas (the result is instant) — just the final
+    `result` event. Logging matches /analyze: one JSONL record per request.
+    """
+    t0 = time.perf_counter()
+    request_id = uuid.uuid4().hex
+
+    async def event_source():
+        try:
+            if USE_OPENAI:
+                body = b""
+                async for kind, event in analyze_quote_openai_stream(
+                    quote_text=req.quote_text, request_id=request_id, no_cache=req.no_cache
+                ):
+                    if kind == "delta":
+                        yield f"event: delta\ndata: {orjson.dumps(event).decode()}\n\n"
+                    else:
+                        body, payload, latency_ms = event
+                _log_analyze_payload_success(payload=payload, request_id=request_id, latency_ms=latency_ms)
+            else:
+                latency_ms = int((time.perf_counter() - t0) * 1000)
+                result = analyze_quote_stub(quote_text=req.quote_text, request_id=request_id, latency_ms=latency_ms)
+                _log_analyze_success(result=result, request_id=request_id, latency_ms=latency_ms)
+                body = dump_result_json(result)
+
+            yield b"event: result\ndata: " + body + b"\n\n"
+
+        except Exception as e:
+            latency_ms = int((time.perf_counter() - t0) * 1000)
+            _log_analyze_failure(request_id=request_id, latency_ms=latency_ms, error=e)
+            yield f"event: error\ndata: {orjson.dumps(f'{type(e).__name__}: {e}').decode()}\n\n"
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
+
+
+def _require_batch_mode() -> None:
+    """Guard the offline batch endpoints behind their feature flags."""
+    if not (BATCH_MODE and USE_OPENAI):
+        raise HTTPException(
+            status_code=404,
+            detail="Batch mode is not enabled (requires QUOTECHECK_BATCH_MODE=1 and QUOTECHECK_USE_OPENAI=1).",
         )
-        raise
\ No newline at end of file
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(req: BatchAnalyzeRequest):
+    """
+    Submit quotes to the offline OpenAI Batch pipeline (bulk scans).
+
+    Returns the batch id and one request_id per quote (in order). Results
+    arrive within the Batch API's 24h window at ~50% of the interactive
+    token price — poll GET /analyze/batch/{batch_id} to collect them.
+    Requires QUOTECHECK_BATCH_MODE=1 and OpenAI mode.
+    """
+    _require_batch_mode()
+    from backend.core.openai_batch import submit_quote_batch
+
+    return await submit_quote_batch(req.quote_texts)
+
+
+@app.get("/analyze/batch/{batch_id}")
+async def analyze_batch_status(batch_id: str):
+    """
+    Check an offline batch; on completion, return its validated results.
+
+    While in flight: {"batch_id", "status"}. On completion, adds "results"
+    (one QuoteCheckResult per quote, metadata overridden with server-truth)
+    and "errors" for any line that failed, and logs one JSONL record per
+    quote — the offline counterpart of /analyze's per-request record.
+    """
+    _require_batch_mode()
+    from backend.core.openai_batch import retrieve_quote_batch
+
+    return await retrieve_quote_batch(batch_id)
\ No newline at end of file
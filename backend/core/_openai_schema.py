@@ -0,0 +1,242 @@
+"""
+OpenAI strict JSON schema for QuoteCheckResult.
+
+Generated by scripts/gen_openai_schema.py — DO NOT EDIT BY HAND.
+Regenerate (and commit) after any change to backend/core/schema.py;
+verify with `python3 scripts/gen_openai_schema.py --check`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+SCHEMA: Dict[str, Any] = {'$defs': {'LineItem': {'description': 'A single extracted line item from the quote.\n'
+                                       '\n'
+                                       'name_raw: original text as present in the quote.\n'
+                                       'normalized_category: v0 taxonomy category.\n'
+                                       'explanation: plain-English understanding of what the item '
+                                       'is and why a vendor\n'
+                                       '    might recommend it (quote-understanding, not risk '
+                                       'judgment).\n'
+                                       'vague_or_confusing: explicit flag for '
+                                       'unclear/bundled/generic charges.\n'
+                                       'recommended_action: what the user should do next.\n'
+                                       'risk_level: green/yellow/red\n'
+                                       'confidence: 0..1 subjective confidence in the '
+                                       'classification\n'
+                                       'rationale_short: short risk-flag rationale (1-2 sentences)',
+                        'properties': {'confidence': {'maximum': 1.0,
+                                                      'minimum': 0.0,
+                                                      'title': 'Confidence',
+                                                      'type': 'number'},
+                                       'evidence_needed': {'description': 'What evidence to ask '
+                                                                          'for (photos, '
+                                                                          'measurements, codes).',
+                                                           'items': {'type': 'string'},
+                                                           'title': 'Evidence Needed',
+                                                           'type': 'array'},
+                                       'explanation': {'default': '',
+                                                       'description': 'Plain-English explanation '
+                                                                      'of what this line item is '
+                                                                      'and why a vendor might '
+                                                                      'recommend it, written for a '
+                                                                      'non-expert. Distinct from '
+                                                                      'rationale_short, which is '
+                                                                      'the risk-flag rationale. '
+                                                                      'The default empty string '
+                                                                      'exists only for Python-side '
+                                                                      'backward compatibility; '
+                                                                      'analyzers must always '
+                                                                      'populate this with a '
+                                                                      'non-empty explanation.',
+                                                       'title': 'Explanation',
+                                                       'type': 'string'},
+                                       'name_raw': {'minLength': 1,
+                                                    'title': 'Name Raw',
+                                                    'type': 'string'},
+                                       'normalized_category': {'enum': ['safety_critical',
+                                                                        'preventive_maintenance',
+                                                                        'wear_and_tear',
+                                                                        'cosmetic_or_upsell',
+                                                                        'unknown_needs_clarification'],
+                                                               'title': 'Normalized Category',
+                                                               'type': 'string'},
+                                       'price': {'anyOf': [{'$ref': '#/$defs/Price'},
+                                                           {'type': 'null'}],
+                                                 'default': None},
+                                       'rationale_short': {'description': 'Short risk-flag '
+                                                                          'rationale (1-2 '
+                                                                          'sentences), not the '
+                                                                          'plain-English '
+                                                                          'explanation (see '
+                                                                          '`explanation`).',
+                                                           'minLength': 1,
+                                                           'title': 'Rationale Short',
+                                                           'type': 'string'},
+                                       'recommended_action': {'enum': ['approve',
+                                                                       'consider',
+                                                                       'defer',
+                                                                       'ask_for_evidence',
+                                                                       'needs_inspection',
+                                                                       'unknown'],
+                                                              'title': 'Recommended Action',
+                                                              'type': 'string'},
+                                       'risk_level': {'enum': ['green', 'yellow', 'red'],
+                                                      'title': 'Risk Level',
+                                                      'type': 'string'},
+                                       'vague_or_confusing': {'default': False,
+                                                              'description': 'True when this '
+                                                                             'charge is unclear, '
+                                                                             'vague, bundled, or '
+                                                                             'hard for a normal '
+                                                                             'customer to '
+                                                                             'understand (e.g. '
+                                                                             'generic naming, no '
+                                                                             'breakdown), '
+                                                                             'independent of '
+                                                                             'normalized_category.',
+                                                              'title': 'Vague Or Confusing',
+                                                              'type': 'boolean'}},
+                        'required': ['confidence',
+                                     'evidence_needed',
+                                     'explanation',
+                                     'name_raw',
+                                     'normalized_category',
+                                     'price',
+                                     'rationale_short',
+                                     'recommended_action',
+                                     'risk_level',
+                                     'vague_or_confusing'],
+                        'title': 'LineItem',
+                        'type': 'object',
+                        'additionalProperties': False},
+           'MetaData': {'description': 'Per-run metadata for traceability and observability.\n'
+                                       '\n'
+                                       'prompt_version: internal prompt/version string (e.g., '
+                                       'quotecheck_v0.1)\n'
+                                       'model: model identifier used for generation\n'
+                                       'created_at: ISO timestamp\n'
+                                       'request_id: UUID string created per request\n'
+                                       'latency_ms: wall-clock latency measured by server\n'
+                                       'schema_valid: whether the response validated against this '
+                                       'schema',
+                        'properties': {'created_at': {'format': 'date-time',
+                                                      'title': 'Created At',
+                                                      'type': 'string'},
+                                       'latency_ms': {'minimum': 0,
+                                                      'title': 'Latency Ms',
+                                                      'type': 'integer'},
+                                       'model': {'minLength': 1,
+                                                 'title': 'Model',
+                                                 'type': 'string'},
+                                       'prompt_version': {'minLength': 1,
+                                                          'title': 'Prompt Version',
+                                                          'type': 'string'},
+                                       'request_id': {'minLength': 1,
+                                                      'title': 'Request Id',
+                                                      'type': 'string'},
+                                       'schema_valid': {'title': 'Schema Valid',
+                                                        'type': 'boolean'}},
+                        'required': ['created_at',
+                                     'latency_ms',
+                                     'model',
+                                     'prompt_version',
+                                     'request_id',
+                                     'schema_valid'],
+                        'title': 'MetaData',
+                        'type': 'object',
+                        'additionalProperties': False},
+           'Price': {'description': 'Optional price information for line item.',
+                     'properties': {'amount': {'minimum': 0, 'title': 'Amount', 'type': 'number'},
+                                    'currency': {'description': 'Currency code or symbol (e.g., '
+                                                                'INR, USD, ₹)',
+                                                 'minLength': 1,
+                                                 'title': 'Currency',
+                                                 'type': 'string'}},
+                     'required': ['amount', 'currency'],
+                     'title': 'Price',
+                     'type': 'object',
+                     'additionalProperties': False},
+           'Refusal': {'description': 'A structured refusal explanation.',
+                       'properties': {'message': {'minLength': 1,
+                                                  'title': 'Message',
+                                                  'type': 'string'},
+                                      'type': {'enum': ['unsafe_instruction',
+                                                        'illegal',
+                                                        'medical_like_advice',
+                                                        'other'],
+                                               'title': 'Type',
+                                               'type': 'string'}},
+                       'required': ['message', 'type'],
+                       'title': 'Refusal',
+                       'type': 'object',
+                       'additionalProperties': False},
+           'UncertaintyMarkers': {'description': 'High-level uncertainty flags to encourage '
+                                                 'verification-first behaviour.\n'
+                                                 '\n'
+                                                 'These markers are useful for:\n'
+                                                 '- product UX ("we need more info")\n'
+                                                 '- eval tests ("did the system admit uncertainty '
+                                                 'when it should?")\n'
+                                                 '- logging and monitoring',
+                                  'properties': {'ambiguous_items_present': {'title': 'Ambiguous '
+                                                                                      'Items '
+                                                                                      'Present',
+                                                                             'type': 'boolean'},
+                                                 'missing_vehicle_context': {'title': 'Missing '
+                                                                                      'Vehicle '
+                                                                                      'Context',
+                                                                             'type': 'boolean'},
+                                                 'needs_mechanic_confirmation': {'title': 'Needs '
+                                                                                          'Mechanic '
+                                                                                          'Confirmation',
+                                                                                 'type': 'boolean'}},
+                                  'required': ['ambiguous_items_present',
+                                               'missing_vehicle_context',
+                                               'needs_mechanic_confirmation'],
+                                  'title': 'UncertaintyMarkers',
+                                  'type': 'object',
+                                  'additionalProperties': False}},
+ 'description': 'Top-level response schema returned by POST / analyze (on success).\n'
+                '\n'
+                'Disclaimer is mandatory to avoid misinterpretation as professional advice.',
+ 'properties': {'disclaimer': {'minLength': 1, 'title': 'Disclaimer', 'type': 'string'},
+                'line_items': {'items': {'$ref': '#/$defs/LineItem'},
+                               'minItems': 1,
+                               'title': 'Line Items',
+                               'type': 'array'},
+                'metadata': {'$ref': '#/$defs/MetaData'},
+                'overall_summary': {'items': {'type': 'string'},
+                                    'maxItems': 5,
+                                    'minItems': 3,
+                                    'title': 'Overall Summary',
+                                    'type': 'array'},
+                'refusals': {'items': {'$ref': '#/$defs/Refusal'},
+                             'title': 'Refusals',
+                             'type': 'array'},
+                'things_to_verify': {'description': 'Missing information / gaps the quote does not '
+                                                    'state that the user needs before approving.',
+                                     'items': {'type': 'string'},
+                                     'minItems': 3,
+                                     'title': 'Things To Verify',
+                                     'type': 'array'},
+                'uncertainty_markers': {'$ref': '#/$defs/UncertaintyMarkers'},
+                'verification_questions': {'description': 'Concrete, vendor-facing questions the '
+                                                          'user can send back to the vendor before '
+                                                          'approving.',
+                                           'items': {'type': 'string'},
+                                           'maxItems': 8,
+                                           'minItems': 3,
+                                           'title': 'Verification Questions',
+                                           'type': 'array'}},
+ 'required': ['disclaimer',
+              'line_items',
+              'metadata',
+              'overall_summary',
+              'refusals',
+              'things_to_verify',
+              'uncertainty_markers',
+              'verification_questions'],
+ 'title': 'QuoteCheckResult',
+ 'type': 'object',
+ 'additionalProperties': False}
@@ -0,0 +1,91 @@
+"""
+Request Batcher (v0)
+
+Coalesces concurrent /analyze calls into one model call.
+
+Why batch?
+- Concurrent quotes share the same system/developer prompt and schema, so one
+  Responses call with N quotes amortizes the HTTP round-trip and prompt prefill
+  across all of them.
+- Under sustained load this trades a small queueing delay (max_queue_time) for
+  a large cut in per-request overhead.
+
+This module is transport-agnostic: it only does the coalescing. The actual
+model call is injected as an async `process_batch` callable, so the OpenAI
+specifics stay in backend/core/openai_analyzer.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, List, Tuple
+
+# One queued request: (quote_text, request_id) plus the future the caller awaits.
+_Entry = Tuple[str, str, "asyncio.Future"]
+
+# The injected batch executor: takes [(quote_text, request_id), ...] and must
+# return one result per entry, in the same order.
+ProcessBatch = Callable[[List[Tuple[str, str]]], Awaitable[list]]
+
+
+class QuoteBatcher:
+    """
+    Micro-batcher: queue requests, flush when the batch is full or the oldest
+    queued request has waited max_queue_time seconds.
+
+    Must be used from a single event loop (FastAPI's), which is also what makes
+    the unlocked list mutation below safe: all methods run on that loop.
+    """
+
+    def __init__(
+        self,
+        process_batch: ProcessBatch,
+        *,
+        max_batch_size: int = 8,
+        max_queue_time: float = 0.05,
+    ) -> None:
+        self._process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: List[_Entry] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def process(self, *, quote_text: str, request_id: str):
+        """
+        Queue one quote and await its result.
+
+        Returns whatever `process_batch` produced for this entry; raises if the
+        batch call failed (every waiter in the batch sees the same exception).
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((quote_text, request_id, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif len(self._pending) == 1:
+            # First entry of a new batch: start the flush timer.
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Take the current batch and dispatch it (sync; runs on the loop)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[_Entry]) -> None:
+        try:
+            results = await self._process_batch([(q, rid) for q, rid, _ in batch])
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as exc:  # noqa: BLE001 - fan the error out to all waiters
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
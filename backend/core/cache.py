@@ -0,0 +1,71 @@
+"""
+Analyze Response Cache (v0)
+
+Exact-match cache for OpenAI analyze results, keyed on normalized quote text.
+
+Why cache?
+- Users commonly paste the same canned service menus and re-check the same
+  quote; each repeat is otherwise a full model round-trip (seconds + cost).
+- An exact hit turns that into a dictionary lookup.
+
+Keying
+------
+The key is a blake2b digest of `quote_text.strip().lower()`, so leading/
+trailing whitespace and casing differences still hit the same entry.
+
+Scope (v0)
+----------
+Exact-match only, in-process, with TTL + LRU eviction — dependency-light,
+matching the rest of the backend. A semantic tier (embeddings + cosine
+threshold) could catch near-duplicates later, but needs an embedding model
+and a vector store we don't have in v0.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def quote_cache_key(quote_text: str) -> str:
+    """Normalize quote text (strip + lowercase) and hash it into a cache key."""
+    return hashlib.blake2b(quote_text.strip().lower().encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """
+    Small in-process TTL + LRU cache.
+
+    Entries expire `ttl` seconds after insertion; when full, the least
+    recently used entry is evicted. Safe for single-event-loop use (no lock):
+    all access happens on FastAPI's loop.
+    """
+
+    def __init__(self, *, maxsize: int = 10_000, ttl: float = 86_400.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Insert/refresh a value, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -22,6 +22,33 @@ import os
 # Feature flags
 USE_OPENAI = os.environ.get("QUOTECHECK_USE_OPENAI", "0") == "1"
 
+# Micro-batching (OpenAI mode only). When enabled, concurrent /analyze requests
+# arriving within a short window are coalesced into one Responses call, which
+# amortizes the HTTP round-trip and prompt prefill across the batch. Off by
+# default: it adds up to ~50ms of queueing delay, which only pays off under
+# sustained concurrent load.
+BATCH_ANALYZE = os.environ.get("QUOTECHECK_BATCH_ANALYZE", "0") == "1"
+
+# Exact-match response cache (OpenAI mode only). Repeated pastes of the same
+# quote text hit an in-process cache instead of re-running the model. On by
+# default: results are deterministic per quote text for our purposes, and a
+# per-request no_cache flag lets callers force a fresh run.
+ANALYZE_CACHE = os.environ.get("QUOTECHECK_ANALYZE_CACHE", "1") == "1"
+
+# Offline batch pipeline (OpenAI Batch API). Enables POST /analyze/batch and
+# GET /analyze/batch/{batch_id} for latency-tolerant bulk scans: ~50% lower
+# cost and separate rate limits, with results within 24h. Off by default and
+# only meaningful together with QUOTECHECK_USE_OPENAI=1.
+BATCH_MODE = os.environ.get("QUOTECHECK_BATCH_MODE", "0") == "1"
+
+# Debug: re-validate interactive OpenAI responses with Pydantic before
+# returning them. Off by default — the Responses API's strict structured
+# output already enforces the JSON schema upstream, so the interactive path
+# passes the model's bytes through (with server-truth metadata injected)
+# without a third JSON pass. Turn on when debugging schema drift; the
+# streaming and offline-batch paths always validate.
+STRICT_VALIDATE = os.environ.get("QUOTECHECK_STRICT_VALIDATE", "0") == "1"
+
 # Model selection (used once we integrate OpenAI)
 MODEL = os.environ.get("QUOTECHECK_MODEL", "gpt-4o-mini")
 
@@ -1,36 +1,134 @@
 """
 OpenAI Analyzer (v0)
 
-Returns a schema-validated QuoteCheckResult (not raw dict) so app.py stays thin.
+Returns (body_bytes, payload_dict, latency_ms) triples: the model's
+strict-schema JSON with server-truth metadata injected, encoded once and
+passed through as the HTTP response body, plus the same document as a dict
+for logging. The Responses API enforces the schema upstream, so by default
+no Pydantic validation runs on this path — set QUOTECHECK_STRICT_VALIDATE=1
+to re-validate (the streaming and offline-batch paths always validate).
+
+The analyzer is async: the OpenAI call is network-bound (typically seconds for
+LLM responses), so we use AsyncOpenAI and await it from an async /analyze
+handler. That keeps the event loop free to serve other requests instead of
+tying up one of FastAPI's threadpool workers per in-flight call.
 """
 
 from __future__ import annotations
 
-import json
 import time
 from datetime import datetime, timezone
-from typing import Tuple
+from typing import AsyncIterator, List, Tuple
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI
 
-from backend.core.config import MODEL, OPENAI_API_KEY
-from backend.core.prompt import PROMPT_VERSION, build_messages
+from backend.core.batcher import QuoteBatcher
+from backend.core.cache import TTLCache, quote_cache_key
+from backend.core.config import ANALYZE_CACHE, BATCH_ANALYZE, MODEL, OPENAI_API_KEY, STRICT_VALIDATE
+from backend.core.prompt import PROMPT_VERSION, build_batch_messages, build_messages
 from backend.core.schema import QuoteCheckResult
-from backend.core.schema_export import quotecheck_result_schema_obj, quotecheck_result_schema_json
+from backend.core.schema_export import quotecheck_result_schema_obj
+
+# One shared client per process (None when the key is missing, e.g. stub mode),
+# so TCP/TLS setup is paid once and keep-alive connections are reused across
+# requests. The explicit pool limits bound concurrent upstream connections;
+# the timeout caps a hung model call at 60s (5s to connect). max_retries uses
+# the SDK's built-in exponential backoff on 429/5xx and connection errors.
+# Guarding on the key lets the module import cleanly when
+# QUOTECHECK_USE_OPENAI=0 and no key is configured.
+_CLIENT = (
+    AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        max_retries=3,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        ),
+    )
+    if OPENAI_API_KEY
+    else None
+)
+
+# The response schema is static after import: build the parsed object once
+# here instead of regenerating it (Pydantic schema build + strict-mode
+# normalization) on every request.
+_SCHEMA_OBJ = quotecheck_result_schema_obj()
+
+# Exact-match response cache (QUOTECHECK_ANALYZE_CACHE, on by default): maps
+# normalized quote text to a validated QuoteCheckResult so repeated pastes of
+# the same quote skip the model call entirely.
+_CACHE = TTLCache(maxsize=10_000, ttl=86_400.0) if ANALYZE_CACHE else None
 
 
-def analyze_quote_openai(*, quote_text: str, request_id: str) -> Tuple[QuoteCheckResult, int]:
-    if not OPENAI_API_KEY:
+async def analyze_quote_openai(*, quote_text: str, request_id: str, no_cache: bool = False) -> Tuple[bytes, dict, int]:
+    """
+    Analyze one quote and return (body_bytes, payload_dict, latency_ms).
+
+    body_bytes is the ready-to-send JSON response (the model's strict-schema
+    output with server-truth metadata injected, encoded exactly once with
+    orjson); payload_dict is the same document as a dict, for logging. When
+    QUOTECHECK_STRICT_VALIDATE=1 the payload is additionally validated
+    against QuoteCheckResult before being returned.
+    """
+    if _CLIENT is None:
         raise RuntimeError("OPENAI_API_KEY is not set. Add it to backend/.env (untracked).")
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    cache_key = quote_cache_key(quote_text) if _CACHE is not None else None
+    if cache_key is not None and not no_cache:
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            return _restamp_cached(cached, request_id=request_id)
+
+    if _BATCHER is not None:
+        body, payload, latency_ms = await _BATCHER.process(quote_text=quote_text, request_id=request_id)
+    else:
+        body, payload, latency_ms = await _analyze_single(quote_text=quote_text, request_id=request_id)
+
+    if cache_key is not None:
+        _CACHE.set(cache_key, payload)
+    return body, payload, latency_ms
+
+
+def _server_metadata(*, request_id: str, latency_ms: int) -> dict:
+    """Server-truth metadata block (orjson serializes the datetime natively)."""
+    return {
+        "prompt_version": PROMPT_VERSION,
+        "model": MODEL,
+        "created_at": datetime.now(timezone.utc),
+        "request_id": request_id,
+        "latency_ms": latency_ms,
+        "schema_valid": True,
+    }
+
+
+def _finalize_payload(payload: dict, *, request_id: str, latency_ms: int) -> Tuple[bytes, dict, int]:
+    """
+    Inject server-truth metadata, optionally strict-validate, and encode the
+    response bytes once.
+    """
+    payload["metadata"] = _server_metadata(request_id=request_id, latency_ms=latency_ms)
+    if STRICT_VALIDATE:
+        QuoteCheckResult.model_validate(payload)
+    return orjson.dumps(payload), payload, latency_ms
+
+
+def _restamp_cached(cached_payload: dict, *, request_id: str) -> Tuple[bytes, dict, int]:
+    """
+    Return a cached payload with fresh server-truth metadata. The shallow
+    copy keeps the cached entry's own metadata untouched; cache hits are
+    effectively instant, so latency_ms is reported as 0.
+    """
+    payload = {**cached_payload, "metadata": _server_metadata(request_id=request_id, latency_ms=0)}
+    return orjson.dumps(payload), payload, 0
+
 
-    schema_str = quotecheck_result_schema_json()
-    schema_obj = quotecheck_result_schema_obj()
-    messages = build_messages(quote_text=quote_text, schema_json=schema_str)
+async def _analyze_single(*, quote_text: str, request_id: str) -> Tuple[bytes, dict, int]:
+    messages = build_messages(quote_text=quote_text)
 
     t0 = time.perf_counter()
-    resp = client.responses.create(
+    resp = await _CLIENT.responses.create(
         model=MODEL,
         input=messages,
         text={
@@ -38,23 +136,131 @@ def analyze_quote_openai(*, quote_text: str, request_id: str) -> Tuple[QuoteChec
                 "type": "json_schema",
                 "name": "QuoteCheckResult",
                 "strict": True,
-                "schema": schema_obj,
+                "schema": _SCHEMA_OBJ,
                 }
             },
     )
     latency_ms = int((time.perf_counter() - t0) * 1000)
 
-    payload = json.loads(resp.output_text.strip())
+    payload = orjson.loads(resp.output_text)
+    return _finalize_payload(payload, request_id=request_id, latency_ms=latency_ms)
+
+
+async def analyze_quote_openai_stream(
+    *, quote_text: str, request_id: str, no_cache: bool = False
+) -> AsyncIterator[Tuple[str, object]]:
+    """
+    Streaming variant of analyze_quote_openai for the interactive path.
+
+    Yields ("delta", text_chunk) events as the model generates output, then
+    exactly one ("result", (body_bytes, payload_dict, latency_ms)) event once
+    the full document has been validated and stamped with server-truth
+    metadata. The UI can render partial output immediately instead of waiting
+    for the whole response. Unlike the non-streaming path, this one always
+    validates: partial deltas can't be schema-checked upstream mid-stream, so
+    the final document is the first place drift would show up.
+
+    Cache hits (same normalized quote text) skip the model call and yield the
+    final result directly. Streaming never goes through the micro-batcher —
+    batching trades latency for throughput, the opposite of what a streaming
+    caller wants.
+    """
+    if _CLIENT is None:
+        raise RuntimeError("OPENAI_API_KEY is not set. Add it to backend/.env (untracked).")
+
+    cache_key = quote_cache_key(quote_text) if _CACHE is not None else None
+    if cache_key is not None and not no_cache:
+        cached = _CACHE.get(cache_key)
+        if cached is not None:
+            yield "result", _restamp_cached(cached, request_id=request_id)
+            return
+
+    messages = build_messages(quote_text=quote_text)
+
+    t0 = time.perf_counter()
+    async with _CLIENT.responses.stream(
+        model=MODEL,
+        input=messages,
+        text={
+            "format": {
+                "type": "json_schema",
+                "name": "QuoteCheckResult",
+                "strict": True,
+                "schema": _SCHEMA_OBJ,
+                }
+            },
+    ) as stream:
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                yield "delta", event.delta
+        resp = await stream.get_final_response()
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+
+    payload = orjson.loads(resp.output_text)
+    QuoteCheckResult.model_validate(payload)
+    payload["metadata"] = _server_metadata(request_id=request_id, latency_ms=latency_ms)
+    body = orjson.dumps(payload)
+    if cache_key is not None:
+        _CACHE.set(cache_key, payload)
+    yield "result", (body, payload, latency_ms)
+
+
+# Strict wrapper schema for batched calls: {"results": [QuoteCheckResult, ...]}.
+# Static, so built once alongside _SCHEMA_OBJ. The result schema's $refs are
+# root-relative (#/$defs/...), so its $defs block must live at the wrapper
+# root — nested under items they would never resolve.
+_BATCH_SCHEMA_OBJ = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {k: v for k, v in _SCHEMA_OBJ.items() if k != "$defs"},
+        }
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+    "$defs": _SCHEMA_OBJ["$defs"],
+}
+
+
+async def _analyze_batch(entries: List[Tuple[str, str]]) -> List[Tuple[bytes, dict, int]]:
+    """
+    Analyze a coalesced batch of (quote_text, request_id) entries in one
+    Responses call. Returns one (body_bytes, payload_dict, latency_ms) per
+    entry, in order; latency_ms is the shared wall-clock time of the batched
+    call.
+    """
+    messages = build_batch_messages(quote_texts=[quote_text for quote_text, _ in entries])
+
+    t0 = time.perf_counter()
+    resp = await _CLIENT.responses.create(
+        model=MODEL,
+        input=messages,
+        text={
+            "format": {
+                "type": "json_schema",
+                "name": "QuoteCheckResultBatch",
+                "strict": True,
+                "schema": _BATCH_SCHEMA_OBJ,
+                }
+            },
+    )
+    latency_ms = int((time.perf_counter() - t0) * 1000)
+
+    payloads = orjson.loads(resp.output_text)["results"]
+    if len(payloads) != len(entries):
+        raise RuntimeError(
+            f"Batched analyze returned {len(payloads)} results for {len(entries)} quotes."
+        )
+
+    # Server-truth metadata + encode per entry, same as the single-quote path.
+    return [
+        _finalize_payload(payload, request_id=request_id, latency_ms=latency_ms)
+        for payload, (_, request_id) in zip(payloads, entries)
+    ]
 
-    # Override metadata with server-truth
-    payload["metadata"] = {
-        "prompt_version": PROMPT_VERSION,
-        "model": MODEL,
-        "created_at": datetime.now(timezone.utc),
-        "request_id": request_id,
-        "latency_ms": latency_ms,
-        "schema_valid": True,
-    }
 
-    result = QuoteCheckResult.model_validate(payload)
-    return result, latency_ms
\ No newline at end of file
+# Coalescer for concurrent requests (QUOTECHECK_BATCH_ANALYZE=1, OpenAI mode).
+# Built once per process; None when the feature is off so the default path
+# stays a plain single-quote call.
+_BATCHER = QuoteBatcher(_analyze_batch, max_batch_size=8, max_queue_time=0.05) if BATCH_ANALYZE else None
\ No newline at end of file
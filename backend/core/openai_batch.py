@@ -0,0 +1,214 @@
+"""
+OpenAI Batch Pipeline (v0)
+
+Offline analysis for latency-tolerant bulk scans (e.g. re-checking an archive
+of saved quotes) via the OpenAI Batch API: upload one JSONL request file,
+create a batch against /v1/responses, and collect results when the batch
+completes (within 24h, at ~50% of the interactive token price and separate
+rate limits).
+
+Flow
+----
+1) submit_quote_batch: one JSONL line per quote (custom_id = request_id),
+   uploaded with purpose="batch", then batches.create(...). Returns the batch
+   id plus the request_ids in quote order.
+2) retrieve_quote_batch: poll on demand. While in flight, returns just the
+   batch status. On completion, downloads the output file, validates each
+   line against QuoteCheckResult (metadata overridden with server-truth, as
+   in the interactive path), and writes one JSONL log record per quote on
+   the first completed poll (repeated polls don't duplicate records).
+
+Gated behind QUOTECHECK_BATCH_MODE=1 (see config.py); requires OpenAI mode.
+Polling is caller-driven (GET per check) rather than a background task —
+v0 has no task lifecycle to hang a poller on, and bulk callers poll rarely.
+"""
+
+from __future__ import annotations
+
+import io
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import orjson
+
+from backend.core.config import APP_RUN_LOG_PATH, MODEL
+from backend.core.openai_analyzer import _CLIENT, _SCHEMA_OBJ
+from backend.core.prompt import PROMPT_VERSION, build_messages
+from backend.core.run_logger import log_app_run
+from backend.core.schema import QuoteCheckResult
+
+
+# Batch ids whose results have already been logged to app_runs.jsonl. Clients
+# are expected to poll, and every poll of a completed batch re-downloads the
+# results — but each quote must produce exactly one log record, so logging
+# happens only on the first completed retrieval per process.
+_logged_batch_ids: set = set()
+
+
+def _require_client():
+    if _CLIENT is None:
+        raise RuntimeError("OPENAI_API_KEY is not set. Add it to backend/.env (untracked).")
+    return _CLIENT
+
+
+async def submit_quote_batch(quote_texts: List[str]) -> Dict[str, Any]:
+    """
+    Upload one batch of quotes and create the OpenAI batch job.
+
+    Returns
+    -------
+    dict
+        {"batch_id": str, "status": str, "request_ids": [str, ...]} with
+        request_ids in the same order as quote_texts (each is the custom_id
+        of its JSONL line, so results can be matched back).
+    """
+    client = _require_client()
+
+    request_ids = [uuid.uuid4().hex for _ in quote_texts]
+    lines = []
+    for quote_text, request_id in zip(quote_texts, request_ids):
+        lines.append(
+            orjson.dumps(
+                {
+                    "custom_id": request_id,
+                    "method": "POST",
+                    "url": "/v1/responses",
+                    "body": {
+                        "model": MODEL,
+                        "input": build_messages(quote_text=quote_text),
+                        "text": {
+                            "format": {
+                                "type": "json_schema",
+                                "name": "QuoteCheckResult",
+                                "strict": True,
+                                "schema": _SCHEMA_OBJ,
+                            }
+                        },
+                    },
+                },
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+
+    upload = await client.files.create(
+        file=("quotecheck_batch.jsonl", io.BytesIO(b"".join(lines))),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/responses",
+        completion_window="24h",
+    )
+    return {"batch_id": batch.id, "status": batch.status, "request_ids": request_ids}
+
+
+async def retrieve_quote_batch(batch_id: str) -> Dict[str, Any]:
+    """
+    Check a batch and, when completed, return its validated results.
+
+    Returns
+    -------
+    dict
+        {"batch_id", "status"} while in flight; on completion also
+        {"results": [QuoteCheckResult-dict, ...]} plus per-quote "errors"
+        (custom_id -> short message) for any line that failed upstream or
+        failed validation. Each completed quote is logged to app_runs.jsonl
+        on the first completed retrieval only — repeated polls return the
+        results again but write no duplicate records.
+    """
+    client = _require_client()
+
+    batch = await client.batches.retrieve(batch_id)
+    summary: Dict[str, Any] = {"batch_id": batch.id, "status": batch.status}
+    if batch.status != "completed" or not batch.output_file_id:
+        return summary
+
+    # Claim the batch for logging before the first await below so a
+    # concurrent poll of the same batch can't log it twice.
+    should_log = batch.id not in _logged_batch_ids
+    _logged_batch_ids.add(batch.id)
+
+    content = await client.files.content(batch.output_file_id)
+    results: List[Dict[str, Any]] = []
+    errors: Dict[str, str] = {}
+
+    for raw_line in content.text.splitlines():
+        if not raw_line.strip():
+            continue
+        line = orjson.loads(raw_line)
+        request_id = line.get("custom_id", "")
+        try:
+            body = line["response"]["body"]
+            result = QuoteCheckResult.model_validate_json(_extract_output_text(body))
+            result = result.model_copy(
+                update={
+                    "metadata": result.metadata.model_copy(
+                        update={
+                            "prompt_version": PROMPT_VERSION,
+                            "model": MODEL,
+                            "created_at": datetime.now(timezone.utc),
+                            "request_id": request_id,
+                            # Wall-clock latency is meaningless for a 24h
+                            # batch window; logged as 0 by convention.
+                            "latency_ms": 0,
+                            "schema_valid": True,
+                        }
+                    )
+                }
+            )
+            results.append(result.model_dump(mode="json"))
+            if should_log:
+                _log_batch_result(result=result, request_id=request_id)
+        except Exception as e:  # noqa: BLE001 - one bad line must not sink the batch
+            errors[request_id] = f"{type(e).__name__}: {e}"
+            if should_log:
+                _log_batch_error(request_id=request_id, error=errors[request_id])
+
+    summary["results"] = results
+    if errors:
+        summary["errors"] = errors
+    return summary
+
+
+def _extract_output_text(body: Dict[str, Any]) -> str:
+    """Pull the generated JSON text out of a raw /v1/responses body."""
+    for item in body.get("output", []):
+        if item.get("type") == "message":
+            for part in item.get("content", []):
+                if part.get("type") == "output_text":
+                    return part["text"]
+    raise ValueError("No output_text found in batch response body.")
+
+
+def _log_batch_result(*, result: QuoteCheckResult, request_id: str) -> None:
+    risk_counts = {"red": 0, "yellow": 0, "green": 0}
+    for it in result.line_items:
+        risk_counts[it.risk_level] += 1
+    log_app_run(
+        log_path=APP_RUN_LOG_PATH,
+        request_id=request_id,
+        prompt_version=PROMPT_VERSION,
+        model=MODEL,
+        latency_ms=0,
+        schema_valid=True,
+        num_items=len(result.line_items),
+        risk_counts=risk_counts,
+        uncertainty=result.uncertainty_markers.model_dump(),
+        error=None,
+    )
+
+
+def _log_batch_error(*, request_id: str, error: str) -> None:
+    log_app_run(
+        log_path=APP_RUN_LOG_PATH,
+        request_id=request_id,
+        prompt_version=PROMPT_VERSION,
+        model=MODEL,
+        latency_ms=0,
+        schema_valid=False,
+        num_items=0,
+        risk_counts={"red": 0, "yellow": 0, "green": 0},
+        uncertainty={},
+        error=error,
+    )
@@ -39,29 +39,75 @@ Do not claim any price benchmarking, market comparison, or "fair price" verifica
 Always include a disclaimer along these lines: "This analysis is informational and should not replace professional advice, official estimates, warranty terms, or a second opinion for high-value or safety-critical work." Only name a specific professional (e.g. "certified mechanic") when the quote is clearly vehicle-related; otherwise use generic wording such as "a qualified professional."
 """
 
-def build_messages(*, quote_text: str, schema_json: str) -> List[Dict[str, str]]:
+BATCH_DEVELOPER_PROMPT = r"""You will receive several independent quotes in one message, each labelled QUOTE <n>.
+Analyze each quote separately, exactly as you would analyze a single quote.
+Return ONLY valid JSON matching the provided schema: an object with a "results" array containing exactly one QuoteCheckResult per quote, in the same order as the QUOTE labels. Do not merge, reorder, or skip quotes."""
+
+
+# Message payload invariants, built once. The system/developer messages are
+# identical for every request (and are never mutated downstream, so sharing
+# the dicts is safe); only the user message varies, and only by quote_text.
+_SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+_DEVELOPER_MSG = {"role": "developer", "content": DEVELOPER_PROMPT}
+_BATCH_DEVELOPER_MSG = {"role": "developer", "content": BATCH_DEVELOPER_PROMPT}
+_USER_PREFIX = (
+    "Here is a service quote. Analyze it and return the structured JSON result.\n\n"
+    "QUOTE: "
+)
+
+
+def build_messages(*, quote_text: str) -> List[Dict[str, str]]:
     """
     Build the message payload for the model.
 
+    The output schema is not embedded here: it travels via the Responses API's
+    structured-output `text.format`, so the only per-request work is splicing
+    quote_text into the constant user-message frame.
+
     Parameters
     ----------
     quote_text: str
         Raw quote text pasted by the user.
-    schema_json: str
-        JSON schema string (or compact representation) describing the required output.
 
     Returns
     -------
     list[dict]
         A list of {role, content} messages suitable for chat-style APIs.
     """
+    return [
+        _SYSTEM_MSG,
+        _DEVELOPER_MSG,
+        {"role": "user", "content": _USER_PREFIX + quote_text + "\n\n"},
+    ]
+
+
+def build_batch_messages(*, quote_texts: List[str]) -> List[Dict[str, str]]:
+    """
+    Build the message payload for a micro-batched call (several quotes, one
+    model round-trip).
 
+    Parameters
+    ----------
+    quote_texts: list[str]
+        Raw quote texts, one per queued request, in queue order.
+
+    Returns
+    -------
+    list[dict]
+        Messages asking for a {"results": [QuoteCheckResult, ...]} response
+        with one entry per quote, in order.
+    """
+    numbered = "\n\n".join(
+        f"QUOTE {i}: {quote_text}" for i, quote_text in enumerate(quote_texts)
+    )
     user_content = (
-        "Here is a service quote. Analyze it and return the structured JSON result.\n\n"
-        f"QUOTE: {quote_text}\n\n"
+        "Here are several independent service quotes. Analyze each one and "
+        "return the structured JSON result for all of them.\n\n"
+        f"{numbered}\n\n"
     )
     return [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "developer", "content": DEVELOPER_PROMPT},
+        _SYSTEM_MSG,
+        _DEVELOPER_MSG,
+        _BATCH_DEVELOPER_MSG,
         {"role": "user", "content": user_content},
     ]
\ No newline at end of file
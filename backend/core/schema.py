@@ -21,9 +21,9 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import List, Literal, Optional, Sequence
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class NormalizedCategory(str, Enum):
@@ -39,6 +39,20 @@ class NormalizedCategory(str, Enum):
     unknown_needs_clarification = "unknown_needs_clarification"
 
 
+# Literal twins of the enums above, used as the *field* types: pydantic-core
+# validates Literal[str, ...] with a Rust-side string-set check and stores the
+# plain string, skipping Python-level enum member lookup/construction on every
+# line item. The Enum classes stay as the canonical taxonomy for Python code;
+# keep each pair in sync.
+NormalizedCategoryT = Literal[
+    "safety_critical",
+    "preventive_maintenance",
+    "wear_and_tear",
+    "cosmetic_or_upsell",
+    "unknown_needs_clarification",
+]
+
+
 class RecommendedAction(str, Enum):
     """
     Suggested user action for a line item, based on risk + ambiguity.
@@ -54,6 +68,9 @@ class RecommendedAction(str, Enum):
     unknown = "unknown"
 
 
+RecommendedActionT = Literal["approve", "consider", "defer", "ask_for_evidence", "needs_inspection", "unknown"]
+
+
 class RiskLevel(str, Enum):
     """
     Risk flag for the next item.
@@ -67,11 +84,16 @@ class RiskLevel(str, Enum):
     red = "red"
 
 
+RiskLevelT = Literal["green", "yellow", "red"]
+
+
 class Price(BaseModel):
     """Optional price information for line item."""
     amount: float = Field(..., ge=0)
     currency: str = Field(..., min_length=1, description="Currency code or symbol (e.g., INR, USD, ₹)")
 
+    model_config = {"frozen": True}
+
 
 class LineItem(BaseModel):
     """
@@ -88,7 +110,7 @@ class LineItem(BaseModel):
     rationale_short: short risk-flag rationale (1-2 sentences)
     """
     name_raw: str = Field(..., min_length=1)
-    normalized_category: NormalizedCategory
+    normalized_category: NormalizedCategoryT
     explanation: str = Field(
         default="",
         description=(
@@ -107,8 +129,8 @@ class LineItem(BaseModel):
             "independent of normalized_category."
         ),
     )
-    recommended_action: RecommendedAction
-    risk_level: RiskLevel
+    recommended_action: RecommendedActionT
+    risk_level: RiskLevelT
     confidence: float = Field(..., ge=0.0, le=1.0)
     rationale_short: str = Field(
         ...,
@@ -117,7 +139,13 @@ class LineItem(BaseModel):
     )
 
     price: Optional[Price] = None
-    evidence_needed: List[str] = Field(default_factory=list, description="What evidence to ask for (photos, measurements, codes).")
+    # Sequence + tuple default: the empty default is the shared () singleton
+    # instead of a fresh list allocated per instance.
+    evidence_needed: Sequence[str] = Field(default_factory=tuple, description="What evidence to ask for (photos, measurements, codes).")
+
+    # Frozen: line items are shared across responses in the stub path, so
+    # accidental mutation after construction must be an error.
+    model_config = {"frozen": True}
 
 
 class UncertaintyMarkers(BaseModel):
@@ -133,6 +161,8 @@ class UncertaintyMarkers(BaseModel):
     missing_vehicle_context: bool
     needs_mechanic_confirmation: bool
 
+    model_config = {"frozen": True}
+
 
 class RefusalType(str, Enum):
     """Types of refusals for risky or innappropriate requests."""
@@ -142,11 +172,16 @@ class RefusalType(str, Enum):
     other = "other"
 
 
+RefusalTypeT = Literal["unsafe_instruction", "illegal", "medical_like_advice", "other"]
+
+
 class Refusal(BaseModel):
     """A structured refusal explanation."""
-    type: RefusalType
+    type: RefusalTypeT
     message: str = Field(..., min_length=1)
 
+    model_config = {"frozen": True}
+
 
 class MetaData(BaseModel):
     """
@@ -166,6 +201,8 @@ class MetaData(BaseModel):
     latency_ms: int = Field(..., ge=0)
     schema_valid: bool
 
+    model_config = {"frozen": True}
+
 
 class QuoteCheckResult(BaseModel):
     """
@@ -194,7 +231,7 @@ class QuoteCheckResult(BaseModel):
             needs_mechanic_confirmation=True,
         )
     )
-    refusals: List[Refusal] = Field(default_factory=list)
+    refusals: Sequence[Refusal] = Field(default_factory=tuple)
     disclaimer: str = Field(..., min_length=1)
 
     metadata: MetaData
@@ -206,7 +243,67 @@ class AnalyzeRequest(BaseModel):
     Accepts either 'quote_text' (preferred) or 'quoteText' (frontend-friendly)
 
     quote_text: the raw quote content pasted by the user.
+    no_cache: opt-out of the analyze response cache ('noCache' alias for the frontend).
     """
     quote_text: str = Field(..., min_length=1, alias="quoteText", description="Raw service quote text pasted by the user.")
+    no_cache: bool = Field(
+        default=False,
+        alias="noCache",
+        description="When true, bypass the analyze response cache and force a fresh model run (OpenAI mode).",
+    )
+
+    model_config = {"populate_by_name": True, "extra": "forbid"}
+
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
\ No newline at end of file
+class BatchAnalyzeRequest(BaseModel):
+    """
+    Request payload for POST /analyze/batch (offline Batch API pipeline).
+
+    quote_texts: raw quote texts to analyze; each gets its own request_id.
+    """
+    quote_texts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        alias="quoteTexts",
+        description="Raw service quote texts to analyze offline (one result per entry).",
+    )
+
+    model_config = {"populate_by_name": True, "extra": "forbid"}
+
+
+# With `from __future__ import annotations` every annotation above is a
+# string that pydantic resolves while building core schemas. Force any
+# deferred resolution now so the first request never pays a lazy rebuild
+# (a no-op for models whose schema is already complete).
+for _m in (Price, LineItem, UncertaintyMarkers, Refusal, MetaData, QuoteCheckResult, AnalyzeRequest, BatchAnalyzeRequest):
+    _m.model_rebuild()
+del _m
+
+
+# Shared serializer for /analyze responses. Building the adapter once at
+# import warms QuoteCheckResult's core schema/serializer (instead of lazily on
+# the first request), and dump_json serializes straight to bytes in
+# pydantic-core — no jsonable_encoder walk, no second validation pass.
+QUOTECHECK_RESULT_ADAPTER: TypeAdapter[QuoteCheckResult] = TypeAdapter(QuoteCheckResult)
+
+# Matching adapter for the request side: validate_json parses + validates raw
+# bytes in one pydantic-core pass (no stdlib json.loads first). FastAPI's
+# handler signature already goes through pydantic-core for /analyze; this is
+# for direct consumers — eval loops, scripts, future batch tooling — that hold
+# a raw body.
+ANALYZE_REQUEST_ADAPTER: TypeAdapter[AnalyzeRequest] = TypeAdapter(AnalyzeRequest)
+
+
+def dump_result_json(result: QuoteCheckResult) -> bytes:
+    """
+    Serialize a locally built QuoteCheckResult to compact response bytes.
+
+    Drops null fields (a line item's absent price), which the frontend
+    already treats as absent. Default-valued fields stay on the wire:
+    uncertainty_markers is a core product signal and README/examples document
+    the full response shape, so nothing else may silently disappear. Only for
+    locally built results (the stub path): the OpenAI path returns the
+    model's strict-schema bytes as-is.
+    """
+    return QUOTECHECK_RESULT_ADAPTER.dump_json(result, exclude_none=True)
\ No newline at end of file
@@ -10,9 +10,10 @@ This is useful for:
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
+import orjson
+
 from backend.core.schema import QuoteCheckResult
 
 
@@ -27,32 +28,43 @@ def _normalize_for_openai_strict(schema: Any) -> Any:
       allowing 'null' in their schema.
 
     This keeps the API happy while allowing "optional in practice" fields to be null.
+
+    Implemented as an iterative depth-first walk that mutates the schema in
+    place: each rule is local to one node, so visit order doesn't matter, and
+    the explicit stack avoids a Python call frame (and the list(...) snapshot
+    the recursive version needed) per nested level.
     """
-    if isinstance(schema, dict):
-        # Recurse first so children are normalized.
-        for k, v in list(schema.items()):
-            schema[k] = _normalize_for_openai_strict(v)
-
-        # If this node is an object schema, enforce strict object rules.
-        if schema.get("type") == "object" and "properties" in schema:
-            props = schema.get("properties", {})
-            schema["additionalProperties"] = False
-
-            # Ensure required contains every property key
-            schema["required"] = list(props.keys())
-
-            # Make properties nullable if they look optional.
-            # Heuristic: if property schema contains "default": None, or is missing from required
-            # in the original schema (we can't see original after overwrite), we allow null for a few known fields.
-            for pname, pschema in props.items():
-                if pname in {"price"}:
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+
+        if isinstance(node, dict):
+            # If this node is an object schema, enforce strict object rules.
+            if node.get("type") == "object" and "properties" in node:
+                # Sort properties so the emitted schema is byte-stable across
+                # model edits and deployments: OpenAI caches the compiled
+                # grammar per exact schema, so a stable key order maximizes
+                # cache hits (first use of a new schema pays extra latency).
+                props = dict(sorted(node["properties"].items()))
+                node["properties"] = props
+                node["additionalProperties"] = False
+
+                # Ensure required contains every property key ([*props]
+                # unpacks the dict's keys without the .keys() view + list()
+                # call pair)
+                node["required"] = [*props]
+
+                # Make properties nullable if they look optional.
+                # Heuristic: if property schema contains "default": None, or is missing from required
+                # in the original schema (we can't see original after overwrite), we allow null for a few known fields.
+                if "price" in props:
                     # Allow null for price
-                    props[pname] = _make_nullable(pschema)
+                    props["price"] = _make_nullable(props["price"])
 
-        return schema
+            stack.extend(node.values())
 
-    if isinstance(schema, list):
-        return [_normalize_for_openai_strict(x) for x in schema]
+        elif isinstance(node, list):
+            stack.extend(node)
 
     return schema
 
@@ -73,14 +85,17 @@ def _make_nullable(pschema: Any) -> Any:
     if "oneOf" in pschema:
         return {"oneOf": pschema["oneOf"] + [{"type": "null"}]}
 
-    # If type is present, turn it into a union with null.
+    # If type is present, turn it into a union with null. Mutating in place is
+    # safe: the caller replaces props[pname] with the return value and never
+    # reuses the old object.
     if "type" in pschema:
         t = pschema["type"]
         if isinstance(t, list):
             if "null" not in t:
                 pschema["type"] = t + ["null"]
-            return pschema
-        return {"type": [t, "null"], **{k: v for k, v in pschema.items() if k != "type"}}
+        else:
+            pschema["type"] = [t, "null"]
+        return pschema
 
     # Otherwise wrap with anyOf
     return {"anyOf": [pschema, {"type": "null"}]}
@@ -90,12 +105,49 @@ def quotecheck_result_schema_obj() -> Dict[str, Any]:
     """
     Return the QuoteCheckResult JSON schema as a dict, post-processed to satisfy
     OpenAI Structured Outputs strict JSON schema requirements.
+
+    The returned dict is the shared module-level instance: the schema is fully
+    static after import, so treat it as read-only.
     """
-    schema = QuoteCheckResult.model_json_schema()
-    schema = _normalize_for_openai_strict(schema)
-    return schema
+    return _SCHEMA_OBJ
 
 
 def quotecheck_result_schema_json() -> str:
     """Return the QuoteCheckResult JSON schema as a JSON string."""
-    return json.dumps(quotecheck_result_schema_obj(), ensure_ascii=False)
\ No newline at end of file
+    return _SCHEMA_JSON
+
+
+def quotecheck_result_schema_bytes() -> bytes:
+    """
+    Return the QuoteCheckResult JSON schema as UTF-8 JSON bytes.
+
+    For consumers that ship the schema over the wire (request bodies, batch
+    JSONL lines) — returns the cached blob directly, no encode step.
+    """
+    return _SCHEMA_JSON_BYTES
+
+
+def _build_schema_obj() -> Dict[str, Any]:
+    """Build the strict schema live from the Pydantic models.
+
+    Used by scripts/gen_openai_schema.py to produce the checked-in
+    _openai_schema module, and as the fallback when that module is absent.
+    """
+    return _normalize_for_openai_strict(QuoteCheckResult.model_json_schema())
+
+
+# The schema is static after import. Prefer the generated module (written by
+# scripts/gen_openai_schema.py), which skips Pydantic JSON-schema generation
+# and the normalization walk at startup; fall back to building live if it
+# hasn't been generated. Regenerate the module after any model change in
+# schema.py. The JSON forms derive from the dict here either way, so the
+# constants can't drift from each other.
+try:
+    from backend.core._openai_schema import SCHEMA as _SCHEMA_OBJ
+except ImportError:
+    _SCHEMA_OBJ = _build_schema_obj()
+# orjson emits UTF-8 natively, matching json.dumps(..., ensure_ascii=False).
+# Both the bytes blob and its decoded str are kept: wire consumers take the
+# bytes as-is, prompt/doc consumers take the str.
+_SCHEMA_JSON_BYTES: bytes = orjson.dumps(_SCHEMA_OBJ)
+_SCHEMA_JSON: str = _SCHEMA_JSON_BYTES.decode("utf-8")
\ No newline at end of file
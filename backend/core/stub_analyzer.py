@@ -13,39 +13,47 @@ This module returns a fully schema-valid QuoteCheckResult.
 
 from __future__ import annotations
 
+import re
+import time
 from datetime import datetime, timezone
+from typing import Final
 
 from backend.core.config import DEMO_ANALYZER_MODEL
 from backend.core.prompt import PROMPT_VERSION
 from backend.core.schema import (
     LineItem,
     MetaData,
-    NormalizedCategory,
     Price,
     QuoteCheckResult,
-    RecommendedAction,
-    RiskLevel,
     UncertaintyMarkers,
 )
 
-AC_APPLIANCE_TERMS = [
+# Vehicle keywords, compiled once: one case-insensitive pass over the raw text
+# instead of lowercasing the whole quote and running separate substring scans.
+# Deliberately no \b anchors — substring semantics ("brakes", "tyres") must
+# match the original `in` checks.
+_VEHICLE_RE = re.compile(r"(?P<brake>brake)|(?P<tyre>tyre|tire)", re.IGNORECASE)
+
+# Final tuples: the term sets are fixed vocabulary, not per-request state —
+# immutable and flagged as such for type checkers.
+AC_APPLIANCE_TERMS: Final[tuple[str, ...]] = (
     "air conditioning",
     "air conditioner",
     "compressor",
     "refrigerant",
     "hvac",
     "appliance",
-]
+)
 
-HOME_MAINTENANCE_TERMS = [
+HOME_MAINTENANCE_TERMS: Final[tuple[str, ...]] = (
     "plumbing",
     "electrical",
     "contractor",
     "handyman",
     "renovation",
-]
+)
 
-GENERIC_CHARGE_TERMS = [
+GENERIC_CHARGE_TERMS: Final[tuple[str, ...]] = (
     "misc",
     "miscellaneous",
     "labour",
@@ -55,7 +63,225 @@ GENERIC_CHARGE_TERMS = [
     "consumables",
     "other charges",
     "unitemized charges",
-]
+)
+
+
+def _terms_re(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a term list into one case-insensitive alternation, preserving
+    the substring semantics of the original `term in text_lower` checks."""
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+
+# Compiled once per list: a single C-level pass over the raw text replaces
+# lowercasing the whole quote plus one substring scan per term.
+_AC_APPLIANCE_RE = _terms_re(AC_APPLIANCE_TERMS)
+_HOME_MAINTENANCE_RE = _terms_re(HOME_MAINTENANCE_TERMS)
+_GENERIC_CHARGE_RE = _terms_re(GENERIC_CHARGE_TERMS)
+
+
+# The stub always reports full uncertainty; one shared instance is enough.
+_UNCERTAINTY_MARKERS = UncertaintyMarkers(
+    ambiguous_items_present=True,
+    missing_vehicle_context=True,
+    needs_mechanic_confirmation=True,
+)
+
+
+# The stub's line items are constants: build (and validate) each once at
+# import and append shared references per request instead of re-running
+# Pydantic validation on identical literals every call. Safe to share —
+# nothing in the serving path mutates a LineItem after construction.
+_BRAKE_ITEM = LineItem(
+    name_raw="Brake service/ pads (from quote)",
+    normalized_category="safety_critical",
+    explanation=(
+        "Brake pads are the friction material that presses on the rotor "
+        "to slow the vehicle. A shop typically recommends replacement "
+        "when pad thickness drops below a safe threshold or the rotor "
+        "shows wear."
+    ),
+    vague_or_confusing=False,
+    recommended_action="needs_inspection",
+    risk_level="red",
+    confidence=0.70,
+    rationale_short="Braking components are safety-critical. Ask for pad thickness and rotor condition evidence.",
+    price=None,
+    evidence_needed=[
+        "Pad thickness measurement (mm)",
+        "Rotor condition photo",
+        "Reason for replacement",
+    ],
+)
+
+_TYRE_ITEM = LineItem(
+    name_raw="Tyre replacement (from quote)",
+    normalized_category="safety_critical",
+    explanation=(
+        "Tyres are the vehicle's only contact with the road, so tread "
+        "depth and condition affect braking, handling, and grip. A shop "
+        "recommends replacement or rotation to keep wear even and "
+        "maintain safe tread depth."
+    ),
+    vague_or_confusing=False,
+    recommended_action="ask_for_evidence",
+    risk_level="yellow",
+    confidence=0.65,
+    rationale_short="Tyres affect braking and handling. Ask for tread depth and sidewall condition details.",
+    price=Price(amount=0.0, currency="INR"),
+    evidence_needed=[
+        "Tread depth (mm)",
+        "Uneven wear explanation",
+        "Sidewall damage photo (if any)",
+    ],
+)
+
+_AC_ITEM = LineItem(
+    name_raw="AC/appliance repair (from quote)",
+    normalized_category="wear_and_tear",
+    explanation=(
+        "An AC compressor or refrigerant charge is part of an appliance's "
+        "cooling system. A technician typically recommends this when "
+        "cooling output drops, the system is losing refrigerant, or a "
+        "diagnostic points to a failing component."
+    ),
+    vague_or_confusing=False,
+    recommended_action="ask_for_evidence",
+    risk_level="yellow",
+    confidence=0.55,
+    rationale_short="Appliance/HVAC repair scope varies widely; ask for a diagnostic report before approving.",
+    price=None,
+    evidence_needed=[
+        "Diagnostic report or fault code",
+        "Unit model/serial number and warranty status",
+        "Refrigerant type and quantity used (if applicable)",
+    ],
+)
+
+_HOME_ITEM = LineItem(
+    name_raw="Home maintenance/contractor work (from quote)",
+    normalized_category="preventive_maintenance",
+    explanation=(
+        "General home maintenance or contractor work (e.g. plumbing, "
+        "electrical, or handyman tasks) covers a wide range of possible "
+        "scope. A contractor typically recommends it based on a site "
+        "visit or inspection rather than a fixed catalog part."
+    ),
+    vague_or_confusing=False,
+    recommended_action="consider",
+    risk_level="green",
+    confidence=0.50,
+    rationale_short="Home maintenance scope varies by property; ask for a written scope of work before approving.",
+    price=None,
+    evidence_needed=[
+        "Scope-of-work breakdown by task",
+        "Materials list with quantities",
+        "Labor hours estimate",
+    ],
+)
+
+_GENERIC_CHARGE_ITEM = LineItem(
+    name_raw="Other/unspecified charges (from quote)",
+    normalized_category="unknown_needs_clarification",
+    explanation=(
+        "The quote mentions one or more generically named or "
+        "un-itemized charges (e.g. misc, labour, service charge, gas "
+        "top-up). This stub cannot know what they specifically cover "
+        "without an itemized breakdown from the vendor."
+    ),
+    vague_or_confusing=True,
+    recommended_action="ask_for_evidence",
+    risk_level="yellow",
+    confidence=0.40,
+    rationale_short="Generic or bundled charges are unclear without an itemized breakdown; ask the vendor to itemize them.",
+    price=None,
+    evidence_needed=[
+        "Itemized breakdown of what this charge covers",
+        "Confirm whether this is a fixed fee or time-based labour charge",
+    ],
+)
+
+_UNCLEAR_ITEM = LineItem(
+    name_raw="Unclear item(s) - needs clarification",
+    normalized_category="unknown_needs_clarification",
+    explanation=(
+        "The quote text lacks enough detail (e.g. part names, "
+        "measurements) for this stub to explain what the charge covers "
+        "or why it might be recommended."
+    ),
+    vague_or_confusing=True,
+    recommended_action="unknown",
+    risk_level="yellow",
+    confidence=0.35,
+    rationale_short="The quote text lacks enough detail to classify items reliably. Ask the service center for an itemized breakdown.",
+    price=None,
+    evidence_needed=[
+        "Itemized parts + labor list",
+        "Reason for each recommendation",
+    ],
+)
+
+# Constant text blocks for the summary. Per-request lists are built fresh from
+# these (the response must never hold a reference that a later request's
+# insert() could mutate).
+_SUMMARY_BASE = (
+    "This report explains each line item in plain language, flags risk level, and lists questions to ask the vendor before approving.",
+    "Any generically named, bundled, or unclear charges are marked as needing clarification; ask the vendor for an itemized breakdown.",
+    "Price benchmarking is not implemented; no market price comparison is being made.",
+)
+_SUMMARY_VEHICLE = "Safety-critical items (like brakes/tyres) should be verified with evidence before approval."
+
+# Constant question/verification chunks per domain (tuples: the per-request
+# lists are assembled from these, never the other way round).
+_VEHICLE_QUESTIONS = (
+    "Can you share photos or measurements (pad thickness, tread depth) that support the brake/tyre recommendation?",
+    "Is this brake/tyre work needed immediately, or can it wait until after a second opinion?",
+    "Are the replacement parts OEM or aftermarket, and what warranty do they carry?",
+)
+_VEHICLE_VERIFY = (
+    "Confirm current pad thickness and tread depth measurements before approving replacement.",
+    "Check whether the vehicle is still under a manufacturer or extended warranty that could cover this work.",
+    "Get a second opinion from an independent mechanic for safety-critical work before approving.",
+)
+_AC_QUESTIONS = (
+    "What diagnostic fault code or symptom led to the compressor/refrigerant recommendation?",
+    "Is the unit still under manufacturer or extended warranty?",
+    "What refrigerant type and quantity does the job require, and is that reflected in the price?",
+)
+_AC_VERIFY = (
+    "Get the unit's model/serial number and confirm its warranty status before approving.",
+    "Confirm a refrigerant leak was actually located, not just assumed from low pressure.",
+    "Ask whether a full system replacement was considered instead of a compressor repair, and why.",
+)
+_HOME_QUESTIONS = (
+    "Can you provide a written scope of work broken down by task (plumbing, electrical, etc.)?",
+    "What is the estimated labor-hours and materials cost for each task?",
+    "Are permits required for any of this work, and who is responsible for obtaining them?",
+)
+_HOME_VERIFY = (
+    "Request an itemized scope-of-work document before work begins.",
+    "Confirm whether permits are required for any electrical or plumbing work.",
+    "Check the contractor's license and insurance before approving work on your property.",
+)
+_GENERIC_QUESTIONS = (
+    "Can you itemize exactly what the misc/labour/service charge covers?",
+    "Is this a fixed fee or a time-based labour charge, and what's the hourly rate if applicable?",
+    "Does this charge overlap with cost already included in another line item on the quote?",
+)
+_GENERIC_VERIFY = (
+    "Request a line-by-line breakdown of any bundled or generically named charges.",
+    "Confirm this charge isn't duplicating cost already included in another line item.",
+    "Ask whether this charge is negotiable or waivable if you decline related work.",
+)
+_FALLBACK_QUESTIONS = (
+    "Can you resend the quote with itemized parts, labour, and a reason for each recommendation?",
+    "What specific work is being proposed, and what problem is it meant to fix?",
+    "Is this work urgent, or can it wait until you get a second quote?",
+)
+_FALLBACK_VERIFY = (
+    "Ask for a fully itemized breakdown before evaluating this quote further.",
+    "Confirm what underlying problem or symptom prompted this quote.",
+    "Get the vendor's contact info and a written copy of the quote for your records.",
+)
 
 
 def _verifying_professional(*, vehicle_matched: bool, ac_matched: bool, home_matched: bool) -> str:
@@ -69,6 +295,48 @@ def _verifying_professional(*, vehicle_matched: bool, ac_matched: bool, home_mat
     return "qualified professional"
 
 
+def _disclaimer(professional: str) -> str:
+    return (
+        "QuoteCheck results may be incomplete or wrong. This analysis is "
+        "informational and should not replace professional advice, official "
+        "estimates, warranty terms, or a second opinion for high-value or "
+        f"safety-critical work — verify with a {professional}. QuoteCheck "
+        "explains quotes and suggests questions; it does not verify vendor "
+        "claims, guarantee fair pricing, or perform price benchmarking."
+    )
+
+
+# One disclaimer per professional wording, concatenated once at import.
+_DISCLAIMERS = {
+    p: _disclaimer(p)
+    for p in ("certified mechanic", "certified technician", "licensed contractor", "qualified professional")
+}
+
+# Fields that are identical in every stub response; per-request values are
+# spliced over this in one dict-merge before a single model_construct.
+_BASE = {
+    "uncertainty_markers": _UNCERTAINTY_MARKERS,
+    "refusals": (),
+}
+
+# created_at cached per wall-clock second, the same trade run_logger makes
+# for its timestamps: second granularity is plenty for response metadata, and
+# requests within the same second share one datetime instead of each paying
+# a gettimeofday + datetime construction. A race just recomputes the same
+# value, so no lock is needed.
+_last_created_sec = 0
+_last_created = datetime.fromtimestamp(0, timezone.utc)
+
+
+def _utc_now_second() -> datetime:
+    global _last_created_sec, _last_created
+    sec = int(time.time())
+    if sec != _last_created_sec:
+        _last_created_sec = sec
+        _last_created = datetime.fromtimestamp(sec, timezone.utc)
+    return _last_created
+
+
 def _domain_questions_and_verification(
     *, vehicle_matched: bool, ac_matched: bool, home_matched: bool, generic_charge_matched: bool
 ) -> tuple[list[str], list[str]]:
@@ -85,64 +353,24 @@ def _domain_questions_and_verification(
     verify: list[str] = []
 
     if vehicle_matched:
-        questions += [
-            "Can you share photos or measurements (pad thickness, tread depth) that support the brake/tyre recommendation?",
-            "Is this brake/tyre work needed immediately, or can it wait until after a second opinion?",
-            "Are the replacement parts OEM or aftermarket, and what warranty do they carry?",
-        ]
-        verify += [
-            "Confirm current pad thickness and tread depth measurements before approving replacement.",
-            "Check whether the vehicle is still under a manufacturer or extended warranty that could cover this work.",
-            "Get a second opinion from an independent mechanic for safety-critical work before approving.",
-        ]
+        questions += _VEHICLE_QUESTIONS
+        verify += _VEHICLE_VERIFY
 
     if ac_matched:
-        questions += [
-            "What diagnostic fault code or symptom led to the compressor/refrigerant recommendation?",
-            "Is the unit still under manufacturer or extended warranty?",
-            "What refrigerant type and quantity does the job require, and is that reflected in the price?",
-        ]
-        verify += [
-            "Get the unit's model/serial number and confirm its warranty status before approving.",
-            "Confirm a refrigerant leak was actually located, not just assumed from low pressure.",
-            "Ask whether a full system replacement was considered instead of a compressor repair, and why.",
-        ]
+        questions += _AC_QUESTIONS
+        verify += _AC_VERIFY
 
     if home_matched:
-        questions += [
-            "Can you provide a written scope of work broken down by task (plumbing, electrical, etc.)?",
-            "What is the estimated labor-hours and materials cost for each task?",
-            "Are permits required for any of this work, and who is responsible for obtaining them?",
-        ]
-        verify += [
-            "Request an itemized scope-of-work document before work begins.",
-            "Confirm whether permits are required for any electrical or plumbing work.",
-            "Check the contractor's license and insurance before approving work on your property.",
-        ]
+        questions += _HOME_QUESTIONS
+        verify += _HOME_VERIFY
 
     if generic_charge_matched:
-        questions += [
-            "Can you itemize exactly what the misc/labour/service charge covers?",
-            "Is this a fixed fee or a time-based labour charge, and what's the hourly rate if applicable?",
-            "Does this charge overlap with cost already included in another line item on the quote?",
-        ]
-        verify += [
-            "Request a line-by-line breakdown of any bundled or generically named charges.",
-            "Confirm this charge isn't duplicating cost already included in another line item.",
-            "Ask whether this charge is negotiable or waivable if you decline related work.",
-        ]
+        questions += _GENERIC_QUESTIONS
+        verify += _GENERIC_VERIFY
 
     if not questions:
-        questions = [
-            "Can you resend the quote with itemized parts, labour, and a reason for each recommendation?",
-            "What specific work is being proposed, and what problem is it meant to fix?",
-            "Is this work urgent, or can it wait until you get a second quote?",
-        ]
-        verify = [
-            "Ask for a fully itemized breakdown before evaluating this quote further.",
-            "Confirm what underlying problem or symptom prompted this quote.",
-            "Get the vendor's contact info and a written copy of the quote for your records.",
-        ]
+        questions = list(_FALLBACK_QUESTIONS)
+        verify = list(_FALLBACK_VERIFY)
 
     return questions, verify
 
@@ -166,171 +394,37 @@ def analyze_quote_stub(*, quote_text: str, request_id: str, latency_ms: int) ->
     QuoteCheckResult
         Deterministic, schema-valid output.
     """
-    text_lower = quote_text.lower()
     items = []
 
-    vehicle_matched = "brake" in text_lower or "tyre" in text_lower or "tire" in text_lower
-    ac_matched = any(term in text_lower for term in AC_APPLIANCE_TERMS)
-    home_matched = any(term in text_lower for term in HOME_MAINTENANCE_TERMS)
-    generic_charge_matched = any(term in text_lower for term in GENERIC_CHARGE_TERMS)
-
-    if "brake" in text_lower:
-        items.append(
-            LineItem(
-                name_raw="Brake service/ pads (from quote)",
-                normalized_category=NormalizedCategory.safety_critical,
-                explanation=(
-                    "Brake pads are the friction material that presses on the rotor "
-                    "to slow the vehicle. A shop typically recommends replacement "
-                    "when pad thickness drops below a safe threshold or the rotor "
-                    "shows wear."
-                ),
-                vague_or_confusing=False,
-                recommended_action=RecommendedAction.needs_inspection,
-                risk_level=RiskLevel.red,
-                confidence=0.70,
-                rationale_short="Braking components are safety-critical. Ask for pad thickness and rotor condition evidence.",
-                price=None,
-                evidence_needed=[
-                    "Pad thickness measurement (mm)",
-                    "Rotor condition photo",
-                    "Reason for replacement",
-                ],
-            )
-        )
-
-    if "tyre" in text_lower or "tire" in text_lower:
-        items.append(
-            LineItem(
-                name_raw="Tyre replacement (from quote)",
-                normalized_category=NormalizedCategory.safety_critical,
-                explanation=(
-                    "Tyres are the vehicle's only contact with the road, so tread "
-                    "depth and condition affect braking, handling, and grip. A shop "
-                    "recommends replacement or rotation to keep wear even and "
-                    "maintain safe tread depth."
-                ),
-                vague_or_confusing=False,
-                recommended_action=RecommendedAction.ask_for_evidence,
-                risk_level=RiskLevel.yellow,
-                confidence=0.65,
-                rationale_short="Tyres affect braking and handling. Ask for tread depth and sidewall condition details.",
-                price=Price(amount=0.0, currency="INR"),
-                evidence_needed=[
-                    "Tread depth (mm)",
-                    "Uneven wear explanation",
-                    "Sidewall damage photo (if any)",
-                ],
-            )
-        )
+    vehicle_terms = {m.lastgroup for m in _VEHICLE_RE.finditer(quote_text)}
+    brake_matched = "brake" in vehicle_terms
+    tyre_matched = "tyre" in vehicle_terms
+    vehicle_matched = bool(vehicle_terms)
+    ac_matched = _AC_APPLIANCE_RE.search(quote_text) is not None
+    home_matched = _HOME_MAINTENANCE_RE.search(quote_text) is not None
+    generic_charge_matched = _GENERIC_CHARGE_RE.search(quote_text) is not None
+
+    if brake_matched:
+        items.append(_BRAKE_ITEM)
+
+    if tyre_matched:
+        items.append(_TYRE_ITEM)
 
     if ac_matched:
-        items.append(
-            LineItem(
-                name_raw="AC/appliance repair (from quote)",
-                normalized_category=NormalizedCategory.wear_and_tear,
-                explanation=(
-                    "An AC compressor or refrigerant charge is part of an appliance's "
-                    "cooling system. A technician typically recommends this when "
-                    "cooling output drops, the system is losing refrigerant, or a "
-                    "diagnostic points to a failing component."
-                ),
-                vague_or_confusing=False,
-                recommended_action=RecommendedAction.ask_for_evidence,
-                risk_level=RiskLevel.yellow,
-                confidence=0.55,
-                rationale_short="Appliance/HVAC repair scope varies widely; ask for a diagnostic report before approving.",
-                price=None,
-                evidence_needed=[
-                    "Diagnostic report or fault code",
-                    "Unit model/serial number and warranty status",
-                    "Refrigerant type and quantity used (if applicable)",
-                ],
-            )
-        )
+        items.append(_AC_ITEM)
 
     if home_matched:
-        items.append(
-            LineItem(
-                name_raw="Home maintenance/contractor work (from quote)",
-                normalized_category=NormalizedCategory.preventive_maintenance,
-                explanation=(
-                    "General home maintenance or contractor work (e.g. plumbing, "
-                    "electrical, or handyman tasks) covers a wide range of possible "
-                    "scope. A contractor typically recommends it based on a site "
-                    "visit or inspection rather than a fixed catalog part."
-                ),
-                vague_or_confusing=False,
-                recommended_action=RecommendedAction.consider,
-                risk_level=RiskLevel.green,
-                confidence=0.50,
-                rationale_short="Home maintenance scope varies by property; ask for a written scope of work before approving.",
-                price=None,
-                evidence_needed=[
-                    "Scope-of-work breakdown by task",
-                    "Materials list with quantities",
-                    "Labor hours estimate",
-                ],
-            )
-        )
+        items.append(_HOME_ITEM)
 
     if generic_charge_matched:
-        items.append(
-            LineItem(
-                name_raw="Other/unspecified charges (from quote)",
-                normalized_category=NormalizedCategory.unknown_needs_clarification,
-                explanation=(
-                    "The quote mentions one or more generically named or "
-                    "un-itemized charges (e.g. misc, labour, service charge, gas "
-                    "top-up). This stub cannot know what they specifically cover "
-                    "without an itemized breakdown from the vendor."
-                ),
-                vague_or_confusing=True,
-                recommended_action=RecommendedAction.ask_for_evidence,
-                risk_level=RiskLevel.yellow,
-                confidence=0.40,
-                rationale_short="Generic or bundled charges are unclear without an itemized breakdown; ask the vendor to itemize them.",
-                price=None,
-                evidence_needed=[
-                    "Itemized breakdown of what this charge covers",
-                    "Confirm whether this is a fixed fee or time-based labour charge",
-                ],
-            )
-        )
+        items.append(_GENERIC_CHARGE_ITEM)
 
     if not items:
-        items.append(
-            LineItem(
-                name_raw="Unclear item(s) - needs clarification",
-                normalized_category=NormalizedCategory.unknown_needs_clarification,
-                explanation=(
-                    "The quote text lacks enough detail (e.g. part names, "
-                    "measurements) for this stub to explain what the charge covers "
-                    "or why it might be recommended."
-                ),
-                vague_or_confusing=True,
-                recommended_action=RecommendedAction.unknown,
-                risk_level=RiskLevel.yellow,
-                confidence=0.35,
-                rationale_short="The quote text lacks enough detail to classify items reliably. Ask the service center for an itemized breakdown.",
-                price=None,
-                evidence_needed=[
-                    "Itemized parts + labor list",
-                    "Reason for each recommendation",
-                ],
-            )
-        )
-
-    overall_summary = [
-        "This report explains each line item in plain language, flags risk level, and lists questions to ask the vendor before approving.",
-        "Any generically named, bundled, or unclear charges are marked as needing clarification; ask the vendor for an itemized breakdown.",
-        "Price benchmarking is not implemented; no market price comparison is being made.",
-    ]
+        items.append(_UNCLEAR_ITEM)
+
+    overall_summary = list(_SUMMARY_BASE)
     if vehicle_matched:
-        overall_summary.insert(
-            1,
-            "Safety-critical items (like brakes/tyres) should be verified with evidence before approval.",
-        )
+        overall_summary.insert(1, _SUMMARY_VEHICLE)
 
     professional = _verifying_professional(
         vehicle_matched=vehicle_matched, ac_matched=ac_matched, home_matched=home_matched
@@ -342,29 +436,22 @@ def analyze_quote_stub(*, quote_text: str, request_id: str, latency_ms: int) ->
         generic_charge_matched=generic_charge_matched,
     )
 
-    return QuoteCheckResult(
+    # Every value here is programmer-controlled and already valid (the shared
+    # line items were validated once at import; the lists and disclaimers are
+    # built from constant text above), so model_construct skips the validation
+    # pass that QuoteCheckResult(...) would re-run per request. User input is
+    # still fully validated where it enters (AnalyzeRequest in app.py).
+    return QuoteCheckResult.model_construct(
+        **_BASE,
         line_items=items,
         overall_summary=overall_summary,
         verification_questions=verification_questions,
         things_to_verify=things_to_verify,
-        uncertainty_markers=UncertaintyMarkers(
-            ambiguous_items_present=True,
-            missing_vehicle_context=True,
-            needs_mechanic_confirmation=True,
-        ),
-        refusals=[],
-        disclaimer=(
-            "QuoteCheck results may be incomplete or wrong. This analysis is "
-            "informational and should not replace professional advice, official "
-            "estimates, warranty terms, or a second opinion for high-value or "
-            f"safety-critical work — verify with a {professional}. QuoteCheck "
-            "explains quotes and suggests questions; it does not verify vendor "
-            "claims, guarantee fair pricing, or perform price benchmarking."
-        ),
-        metadata=MetaData(
+        disclaimer=_DISCLAIMERS[professional],
+        metadata=MetaData.model_construct(
             prompt_version=PROMPT_VERSION,
             model=DEMO_ANALYZER_MODEL,
-            created_at=datetime.now(timezone.utc),
+            created_at=_utc_now_second(),
             request_id=request_id,
             latency_ms=latency_ms,
             schema_valid=True,
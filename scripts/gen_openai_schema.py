@@ -0,0 +1,75 @@
+"""
+Regenerate backend/core/_openai_schema.py from the Pydantic models.
+
+The checked-in module lets schema_export skip Pydantic JSON-schema generation
+and the strict-mode normalization walk at import time. Run this after any
+change to the models in backend/core/schema.py:
+
+    python3 scripts/gen_openai_schema.py
+
+and commit the regenerated file alongside the schema change. To verify the
+checked-in module is current (e.g. in review, or a future CI step):
+
+    python3 scripts/gen_openai_schema.py --check
+
+which regenerates in memory, compares against the file, and exits non-zero
+on any difference. A stale module silently wins over the live models (the
+exporter prefers it), so drift here means out-of-contract responses.
+"""
+
+from __future__ import annotations
+
+import pprint
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+OUTPUT_PATH = REPO_ROOT / "backend" / "core" / "_openai_schema.py"
+
+HEADER = '''"""
+OpenAI strict JSON schema for QuoteCheckResult.
+
+Generated by scripts/gen_openai_schema.py — DO NOT EDIT BY HAND.
+Regenerate (and commit) after any change to backend/core/schema.py;
+verify with `python3 scripts/gen_openai_schema.py --check`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+SCHEMA: Dict[str, Any] = '''
+
+
+def _render() -> str:
+    from backend.core.schema_export import _build_schema_obj
+
+    schema = _build_schema_obj()
+    return HEADER + pprint.pformat(schema, width=100, sort_dicts=False) + "\n"
+
+
+def main() -> int:
+    check = "--check" in sys.argv[1:]
+    rendered = _render()
+
+    if check:
+        on_disk = OUTPUT_PATH.read_text(encoding="utf-8") if OUTPUT_PATH.exists() else ""
+        if on_disk != rendered:
+            print(
+                f"{OUTPUT_PATH.relative_to(REPO_ROOT)} is stale — rerun "
+                "`python3 scripts/gen_openai_schema.py` and commit the result.",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"{OUTPUT_PATH.relative_to(REPO_ROOT)} is up to date")
+        return 0
+
+    OUTPUT_PATH.write_text(rendered, encoding="utf-8")
+    print(f"wrote {OUTPUT_PATH.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())